@@ -1,25 +1,33 @@
+import hashlib
+import os
+
 import numpy as np
 
-rng = np.random.default_rng(seed=42)
+rng = np.random.default_rng(np.random.SeedSequence(42))
 
 
 #Simulate Dataset
 num_entities = 100
 
-feature1 = rng.integers(50, 101, size=num_entities)
-feature2 = rng.integers(10, 51, size=num_entities)
-feature3 = rng.integers(10, 501, size=num_entities)
+low = np.array([50, 10, 10], dtype=np.float32)
+high = np.array([101, 51, 501], dtype=np.float32)
 
-data = np.column_stack((feature1, feature2, feature3))
+# Draw uniforms straight into the column-major buffer, then map them to integers in [low, high)
+data = np.empty((num_entities, 3), dtype=np.float32, order='F')
+rng.random(out=data, dtype=np.float32)
+data *= high - low
+np.floor(data, out=data)
+data += low
 print("Dataset shape: ", data.shape)
 print("First 5 rows\n", data[:5])
 
 #Basic Statics 
 
-means = np.mean(data, axis=0)
+means = data.mean(axis=0)
 medians = np.median(data, axis=0)
-variances = np.var(data, axis=0)
-std_devs = np.std(data, axis=0)
+centered = data - means
+variances = np.einsum('ij,ij->j', centered, centered) / data.shape[0]
+std_devs = np.sqrt(variances)
 
 print(f"Means: {means}\nMedians: {medians}\nVariances: {variances}\nStandard Deviations: {std_devs}\n")
 
@@ -27,47 +35,78 @@ print(f"Means: {means}\nMedians: {medians}\nVariances: {variances}\nStandard Dev
 
 #Max-Min normalization
 
-min_vals = np.min(data, axis=0)
-max_vals = np.max(data, axis=0)
+min_vals = data.min(axis=0)
+max_vals = data.max(axis=0)
+range_ = max_vals - min_vals
 
-normalized_data1 = (data - min_vals) / (max_vals - min_vals)
+normalized_data1 = (data - min_vals) * (1.0 / range_)
 print("Normaized_Data1 (first 5 rows):\n", normalized_data1[:5])
 
 #Z normalization
 
-normalized_data2 = (data - means) / variances
-print("Normaized_Data1 (first 5 rows):\n", normalized_data2[:5])
+normalized_data2 = (data - means) / std_devs
+print("Normaized_Data2 (first 5 rows):\n", normalized_data2[:5])
 
 #Weighted Composite Score
 
-weights = np.array([0.5, 0.3, 0.2])
-scores = np.dot(normalized_data1, weights)
+weights = np.array([0.5, 0.3, 0.2], dtype=np.float32)
+projection_matrix = np.array([[0.7, 0.2, 0.1],
+                              [0.1, 0.6, 0.3]], dtype=np.float32)
+
+# Weights ride along as a third projection row, so one GEMM yields both outputs
+combined_T = np.ascontiguousarray(np.vstack([projection_matrix, weights]).T)
+combined = normalized_data1 @ combined_T
+projected_scores = combined[:, :2]
+scores = combined[:, 2]
+
 print("First 5 composite scores:", scores[:5])
 
 #Ranking Entities
 
-rank_indices = np.argsort(scores)[::-1]
-top_10 = scores[rank_indices[:10]]
+k = min(10, scores.size)
+top_k = np.argpartition(scores, -k)[-k:]
+rank_indices = top_k[np.argsort(-scores[top_k])]
+top_10 = scores[rank_indices]
 
 print("Scores of top 10:", top_10)
 
 #Boolean Indexing 
 
-high_perf_engage = (normalized_data1[:,0] > 0.8) & (normalized_data1[:, 1] > 0.7)
-selected_entities = np.where(high_perf_engage)[0]
+performance = normalized_data1[:, 0]
+engagement = normalized_data1[:, 1]
+selected_entities = np.flatnonzero((performance > 0.8) & (engagement > 0.7))
 
 print("Entities with high performance & engagement:", selected_entities)
 
 #Advanced Matrix Operations
 
-projection_matrix = np.array([[0.7, 0.2, 0.1],
-                              [0.1, 0.6, 0.3]])
-projected_scores = normalized_data1.dot(projection_matrix.T)
-
 print("Projected scores shape:", projected_scores.shape)
 print("First 5 projected scores:\n", projected_scores[:5])
 
 #save
 
-np.save("ai_data_intelligence_phase1.npy", data)
-np.save("ai_data_normalized.npy", normalized_data1)
\ No newline at end of file
+def save_if_changed(path, array):
+    # Skip the write when a .hash sidecar shows the file already holds these bytes
+    # Hash the existing buffer in place; a Fortran-order array's transpose is C-contiguous
+    fortran_order = array.flags.f_contiguous and not array.flags.c_contiguous
+    buffer = array.T if fortran_order else np.ascontiguousarray(array)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{array.dtype}{array.shape}{fortran_order}".encode())
+    digest.update(buffer)
+    digest = digest.hexdigest()
+
+    # Only trust the sidecar if the .npy has not been replaced since it was written
+    hash_path = path + ".hash"
+    if os.path.exists(path) and os.path.exists(hash_path) \
+            and os.path.getmtime(path) <= os.path.getmtime(hash_path):
+        with open(hash_path) as f:
+            if f.read() == digest:
+                return
+
+    np.save(path, array)
+    with open(hash_path, "w") as f:
+        f.write(digest)
+
+save_if_changed("ai_data_intelligence_phase1.npy", data)
+save_if_changed("ai_data_normalized.npy", normalized_data1)
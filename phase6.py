@@ -1,6 +1,16 @@
+import hashlib
+import os
+import re
 import pandas as pd
 import numpy as np
 from typing import List, Optional, Union
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
 class Dataset:
     """
     A utility class for handling and preprocessing datasets, 
@@ -31,13 +41,13 @@ class Dataset:
 
     Methods
     -------
-    load():
+    load(dtype=None, converters=None, usecols=None, categoricals=None, cache=False):
         Load the dataset from CSV into a pandas DataFrame.
     
     clean(strategy="mean", columns=None, custom=0, inplace=True):
         Handle missing values in the dataset using specified strategies.
     
-    summarize():
+    summarize(quantiles=True):
         Return descriptive statistics and metadata for all columns.
     
     clean_currency(symbols=['$', ',', '/', ' ']):
@@ -65,22 +75,86 @@ class Dataset:
         self.financial_columns = None
         self.numeric_columns = None
     
-    def load(self):
+    def load(self, dtype=None, converters=None, usecols=None, categoricals=None, cache=False):
         
         """
         Load CSV file into a pandas DataFrame and store in self.data.
 
+        Parameters:
+        -----------
+        dtype : dict or type, default=None
+            Column types passed straight to `pd.read_csv`, so the parser builds
+            the right columns in one pass instead of inferring them.
+        converters : dict, default=None
+            Per-column conversion functions applied while parsing.
+        usecols : list, default=None
+            Subset of columns to read.
+        categoricals : list or dict, default=None
+            Columns to parse as categoricals. A dict maps each column to its
+            list of categories.
+        cache : bool, default=False
+            If True, keep a Parquet copy next to the CSV, keyed by the options
+            above, and reload from it while it is newer than the CSV. Ignored
+            when converters or a callable usecols are given.
+
+        Column names in the options are matched after stripping whitespace,
+        the same way they appear in self.data.
+
         Returns:
         --------
         pd.DataFrame
             The loaded dataset.
         """
         
-        self.data = pd.read_csv(self.file_path)
+        # Callables have no stable key, so converters and callable usecols skip the cache
+        cache = cache and converters is None and not callable(usecols)
+        options_key = hashlib.md5(repr((dtype, usecols, categoricals)).encode()).hexdigest()[:12]
+        cache_path = f"{os.path.splitext(self.file_path)[0]}.{options_key}.parquet"
+
+        if cache and os.path.exists(cache_path) \
+                and os.path.getmtime(cache_path) >= os.path.getmtime(self.file_path):
+            self.data = pd.read_parquet(cache_path)
+            print("✅ Dataset loaded from cache")
+            return self.data
+
+        if categoricals is not None:
+            if isinstance(categoricals, dict):
+                category_types = {col: pd.CategoricalDtype(cats) for col, cats in categoricals.items()}
+            else:
+                category_types = {col: "category" for col in categoricals}
+
+            if dtype is None:
+                dtype = category_types
+            elif isinstance(dtype, dict):
+                dtype = {**dtype, **category_types}
+            else:
+                # Spread a single dtype over every column so the categoricals can override it
+                raw_columns = pd.read_csv(self.file_path, nrows=0).columns
+                dtype = {**{col.strip(): dtype for col in raw_columns}, **category_types}
+
+        # Options use stripped column names, so map them back to the raw CSV headers
+        if dtype is not None or converters is not None or usecols is not None:
+            raw_columns = pd.read_csv(self.file_path, nrows=0).columns
+            raw_names = {col.strip(): col for col in raw_columns}
+
+            if isinstance(dtype, dict):
+                dtype = {raw_names.get(col, col): value for col, value in dtype.items()}
+            if converters is not None:
+                converters = {raw_names.get(col, col): func for col, func in converters.items()}
+            if usecols is not None and not callable(usecols) \
+                    and all(isinstance(col, str) for col in usecols):
+                wanted = set(usecols)
+                usecols = lambda col: col.strip() in wanted
+
+        self.data = pd.read_csv(self.file_path, dtype=dtype, converters=converters,
+                                usecols=usecols, engine="c")
         print("✅ Dataset loaded successfully")
         
         # Clean column names
         self.data.columns = self.data.columns.str.strip()
+
+        if cache:
+            self.data.to_parquet(cache_path)
         
         return self.data
     
@@ -117,16 +191,13 @@ class Dataset:
         df = self.data if inplace else self.data.copy()
 
         if strategy == "mean":
-            for col in columns:
-                df[col] = df[col].fillna(df[col].mean())
+            df[columns] = df[columns].fillna(df[columns].mean(numeric_only=True))
 
         elif strategy == "median":
-            for col in columns:
-                df[col] = df[col].fillna(df[col].median())
+            df[columns] = df[columns].fillna(df[columns].median(numeric_only=True))
 
         elif strategy == "custom":
-            for col in columns:
-                df[col] = df[col].fillna(custom)
+            df[columns] = df[columns].fillna(custom)
 
         elif strategy == "drop":
             df.dropna(subset=columns, inplace=True)
@@ -135,10 +206,17 @@ class Dataset:
         if not inplace:
             return df
 
-    def summarize(self):
+    def summarize(self, quantiles=True):
         """
         Generate descriptive statistics and column metadata for the dataset.
 
+        Parameters:
+        -----------
+        quantiles : bool, default=True
+            If False, skip the 25%/50%/75% rows, which need a partial sort per column,
+            and report only count, mean, std, min and max of the numeric columns.
+            Falls back to `describe()` when there are no numeric columns.
+
         Returns:
         --------
         tuple of pd.DataFrame:
@@ -154,16 +232,23 @@ class Dataset:
         print(stats.head())
         print(col_info)
         """
-        statistics = self.data.describe()  
+        statistics = None
+        if not quantiles:
+            numeric = self.data.select_dtypes(include='number')
+            if not numeric.empty:
+                statistics = numeric.agg(['count', 'mean', 'std', 'min', 'max'])
+        if statistics is None:
+            statistics = self.data.describe()
+
         types = pd.DataFrame({
             "Type": self.data.dtypes,
-            "Non-Null Count": self.data.notnull().sum()
+            "Non-Null Count": self.data.count()
         })
-        
+
         return statistics, types
 
 
-    def detect_numeric(self, threshold=0.7):
+    def detect_numeric(self, threshold=0.7, sample_size=2000):
         """
         Automatically detect numeric and financial columns in the dataset.
 
@@ -176,6 +261,8 @@ class Dataset:
         threshold : float, default=0.7
             Minimum proportion of numeric-like values required to consider a column numeric.
             Columns below this threshold are treated as text.
+        sample_size : int, default=2000
+            Maximum number of non-null values sampled from each column for detection.
 
         Updates
         -------
@@ -188,30 +275,39 @@ class Dataset:
         -----
         - Columns already stored as numeric types (int64, float64) are automatically included.
         - Columns with mixed text and numeric values below the threshold are ignored.
+        - Longer columns are judged on a fixed random sample, so results are repeatable.
         """
         numeric_cols = []
         financial_cols = []
 
-        for col in self.data.columns:
-            if self.data[col].dtype == 'object':
-                sample = self.data[col].dropna().astype(str)
-
-                # Detect financial symbols
-                if sample.str.contains(r'[\$,()]').any():
-                    financial_cols.append(col)
-                    continue
-
-                # Detect numeric-like strings
-                numeric_like = sample.str.replace(r'[^0-9.]', '', regex=True)
-                proportion_numeric = numeric_like.apply(lambda x: x.replace('.', '', 1).isnumeric()).mean()
-
-                if proportion_numeric >= threshold:
-                    numeric_cols.append(col)
+        # Resolve column dtypes once instead of per column
+        object_dtype_cols = self.data.select_dtypes(include='object').columns
+        numeric_dtype_cols = self.data.select_dtypes(include=['int64', 'float64']).columns
+
+        for col in object_dtype_cols:
+            sample = self.data[col].dropna()
+            if len(sample) > sample_size:
+                sample = sample.sample(n=sample_size, random_state=0)
+            sample = sample.astype(str)
+
+            # Detect financial symbols, stopping at the first chunk with a match
+            is_financial = any(
+                sample.iloc[start:start + 256].str.contains(r'[\$,()]').any()
+                for start in range(0, len(sample), 256)
+            )
+            if is_financial:
+                financial_cols.append(col)
+                continue
+
+            # Detect numeric-like strings
+            proportion_numeric = sample.str.fullmatch(r'\s*-?\d+(?:\.\d+)?\s*').mean()
+
+            if proportion_numeric >= threshold:
+                numeric_cols.append(col)
 
         # Add existing numeric columns
-        for col in self.data.select_dtypes(include=['int64', 'float64']).columns:
-            if col not in numeric_cols:
-                numeric_cols.append(col)
+        detected = set(numeric_cols)
+        numeric_cols += [col for col in numeric_dtype_cols if col not in detected]
 
         self.numeric_columns = numeric_cols
         self.financial_columns = financial_cols
@@ -252,20 +348,26 @@ class Dataset:
 
         df = self.data if inplace else self.data.copy()
 
-        
+        # One character class strips every symbol in a single pass
+        symbol_pattern = '[' + ''.join(re.escape(symbol) for symbol in symbols) + ']'
+
+        # Arrow-backed strings keep the .str operations out of Python objects
+        df[self.financial_columns] = df[self.financial_columns].astype(STRING_DTYPE)
 
         for col in self.financial_columns:
-            df[col] = df[col].astype(str).str.strip().replace('', np.nan)
+            df[col] = df[col].str.strip().replace('', np.nan)
 
             # Remove unwanted symbols
-            for symbol in symbols:
-                df[col] = df[col].str.replace(symbol, '', regex=False)
+            if symbols:
+                df[col] = df[col].str.replace(symbol_pattern, '', regex=True)
 
             # Convert parentheses to negative numbers
-            df[col] = df[col].str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+            values = df[col]
+            negative = (values.str.startswith('(') & values.str.endswith(')')).fillna(False)
+            df.loc[negative, col] = '-' + values[negative].str.slice(1, -1)
 
-            # Convert to numeric
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            # Convert to numeric, back on plain float64 with NaN for missing values
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
 
         if inplace:
             self.data = df
@@ -314,8 +416,8 @@ class Dataset:
 
         df = self.data if inplace else self.data.copy()
 
-        for col in columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        if len(columns):
+            df[columns] = df[columns].apply(pd.to_numeric, errors='coerce')
 
         if inplace:
             self.data = df
@@ -13,7 +13,6 @@ dataset = Dataset("financials.csv")
 dataset.load()
 print("First 5 rows:")
 print(dataset.data.head())
-print(dataset.summarize())
 
 # 4️⃣ Converts currency data to numeric
 